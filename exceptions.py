@@ -1,8 +1,3 @@
 class BadHTTPStatus(Exception):
     """Статус не 200"""
     pass
-
-
-class TokenLack(Exception):
-    """Отсутствие токена"""
-    pass
@@ -1,14 +1,18 @@
 import logging
 import os
+import random
 import sys
 import time
+from collections import OrderedDict
 from http import HTTPStatus
 
 import requests
 import telegram
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from exceptions import BadHTTPStatus, TokenLack
+from exceptions import BadHTTPStatus
 
 load_dotenv()
 
@@ -16,11 +20,56 @@ load_dotenv()
 PRACTICUM_TOKEN = os.getenv("PRACTICUM_TOKEN")
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+TOKEN_NAMES = ("PRACTICUM_TOKEN", "TELEGRAM_TOKEN", "TELEGRAM_CHAT_ID")
 
 ANTISPAM_TIME = 10
+MESSAGE_MAX_LENGTH = 4096
+# Сколько последних отправленных статусов помним для защиты от повторов
+SENT_STATUSES_LIMIT = 512
+# Интервал опроса адаптивный: после новых статусов проверяем чаще,
+# при тишине интервал удваивается вплоть до RETRY_TIME
+MIN_RETRY_TIME = 60
 RETRY_TIME = 600
+# Одинаковую ошибку повторно отправляем в телеграм не чаще раза в час
+ERROR_REPEAT_TIME = 3600
 ENDPOINT = "https://practicum.yandex.ru/api/user_api/homework_statuses/"
-HEADERS = {"Authorization": f"OAuth {PRACTICUM_TOKEN}"}
+# (connect, read) - чтобы запрос не висел бесконечно
+REQUEST_TIMEOUT = (5, 30)
+# Всего попыток запроса, включая первую
+REQUEST_ATTEMPTS = 5
+RETRY_BACKOFF_MAX = 60
+
+
+class JitterRetry(Retry):
+    """Экспоненциальная пауза между повторами со случайным разбросом."""
+
+    def get_backoff_time(self):
+        """Случайная пауза в пределах RETRY_BACKOFF_MAX."""
+        backoff = min(RETRY_BACKOFF_MAX, super().get_backoff_time())
+        return random.uniform(0, backoff)
+
+
+# Одна сессия на всё время работы бота: TCP/TLS соединение
+# переиспользуется между опросами, а не открывается заново каждый раз
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=1,
+        # Кратковременные сбои сети и 5xx повторяем сразу,
+        # а не ждем следующего опроса
+        max_retries=JitterRetry(
+            # total в urllib3 считает повторы, а не попытки
+            total=REQUEST_ATTEMPTS - 1,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            # После последней попытки отдаем ответ как есть,
+            # чтобы код ответа разобрал get_api_answer
+            raise_on_status=False,
+        ),
+    ),
+)
 
 
 HOMEWORK_VERDICTS = {
@@ -28,9 +77,20 @@ HOMEWORK_VERDICTS = {
     "reviewing": "Работа взята на проверку ревьюером.",
     "rejected": "Работа проверена: у ревьюера есть замечания.",
 }
+# Хвост сообщения статичен для каждого статуса, собираем его заранее
+STATUS_MESSAGE_PREFIX = 'Изменился статус проверки работы "'
+VERDICT_MESSAGES = {
+    status: f'". {verdict}' for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
+LOG_FORMAT = "%(asctime)s  [%(levelname)s]  %(message)s"
 
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logger = logging.getLogger(__name__)
-logger.addHandler(logging.StreamHandler(sys.stdout))
+logger.addHandler(_stdout_handler)
+# Иначе каждая запись продублируется корневым логгером из basicConfig
+logger.propagate = False
 
 
 def send_message(bot, message):
@@ -38,32 +98,37 @@ def send_message(bot, message):
     try:
         bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message)
     except Exception as exc:
-        logger.error("Не удается отправить сообщение в телеграм.\n"
-                     f"Ошибка: {exc}")
+        logger.error(
+            "Не удается отправить сообщение в телеграм.\nОшибка: %s", exc
+        )
         return False
 
-    logger.info(f"Отправили сообщение: {message}")
+    logger.info("Отправили сообщение: %s", message)
     return True
 
 
 def get_api_answer(current_timestamp):
     """Делаем запрос к эндпоинту API-сервиса."""
-    timestamp = current_timestamp or int(time.time())
-    params = {"from_date": timestamp}
+    params = {"from_date": current_timestamp}
+    # Собираем заголовок при запросе, а не при импорте,
+    # когда токен мог еще не пройти check_tokens
+    headers = {"Authorization": f"OAuth {PRACTICUM_TOKEN}"}
     logger.info("Запрос к эндпоинту")
     try:
-        response = requests.get(ENDPOINT, headers=HEADERS, params=params)
+        response = SESSION.get(
+            ENDPOINT, headers=headers, params=params, timeout=REQUEST_TIMEOUT
+        )
     except Exception as exc:
-        logger.error(f"Проблема с подключением к эндпоинту {ENDPOINT}")
+        logger.error("Проблема с подключением к эндпоинту %s", ENDPOINT)
         raise exc
 
     # Хотел написать: if not response.ok, но тест не пропускает
     # AttributeError: 'MockResponseGET' object has no attribute 'ok'
     if response.status_code != HTTPStatus.OK:
         logger.error(
-            "(＞︿＜) "
-            f"Эндпоинт {ENDPOINT} недоступен."
-            f"Код ответа API: {response.status_code}"
+            "(＞︿＜) Эндпоинт %s недоступен. Код ответа API: %s",
+            ENDPOINT,
+            response.status_code,
         )
         raise BadHTTPStatus("Код ответа от API не 200.")
     return response.json()
@@ -91,41 +156,116 @@ def parse_status(homework: dict):
     """Извлекает из информации и статус конкретной домашней работы."""
     # Достаем по ключам информацию.
     # Если ключа нет, то логирование и обработка исключения в main'е
+    try:
+        homework_name = homework["homework_name"]
+        homework_status = homework["status"]
+        verdict_message = VERDICT_MESSAGES[homework_status]
+    except KeyError as exc:
+        raise KeyError(
+            "Нет ключа или недокументированный статус домашней работы "
+            f"в ответе API: {exc.args[0]}"
+        ) from exc
+
+    logger.info(
+        "Получили новый статус %s - %s", homework_name, homework_status
+    )
+    return STATUS_MESSAGE_PREFIX + str(homework_name) + verdict_message
+
+
+def _chunks(text: str, size: int):
+    """Делит текст на части не длиннее size по границам абзацев."""
+    chunk = ""
+    for paragraph in text.split("\n\n"):
+        candidate = f"{chunk}\n\n{paragraph}" if chunk else paragraph
+        if len(candidate) <= size:
+            chunk = candidate
+            continue
+        if chunk:
+            yield chunk
+        # Абзац длиннее лимита телеграма режем как есть
+        while len(paragraph) > size:
+            yield paragraph[:size]
+            paragraph = paragraph[size:]
+        chunk = paragraph
+    if chunk:
+        yield chunk
+
+
+def _is_new_status(sent_statuses: OrderedDict, homework: dict) -> bool:
+    """Проверяет, что такой статус домашки еще не отправляли."""
+    # Домашку без статуса не отсеиваем: пусть ошибку поднимет parse_status
+    if "status" not in homework:
+        return True
     homework_name = homework.get("homework_name")
-    homework_status = homework.get("status")
+    return sent_statuses.get(homework_name) != homework["status"]
 
-    if homework_name is None:
-        raise KeyError("Не нашли homework_name в homework")
-    if homework_status is None:
-        raise KeyError("Не нашли status в homework")
 
-    verdict = HOMEWORK_VERDICTS.get(homework_status)
-    if verdict is None:
-        raise KeyError(
-            f"Недокументированный статус {homework_name}"
-            " домашней работы в ответе API"
-        )
+def _remember_status(sent_statuses: OrderedDict, homework: dict):
+    """Запоминает доставленный статус домашки."""
+    homework_name = homework["homework_name"]
+    sent_statuses[homework_name] = homework["status"]
+    sent_statuses.move_to_end(homework_name)
+    if len(sent_statuses) > SENT_STATUSES_LIMIT:
+        sent_statuses.popitem(last=False)
 
-    logger.info(f"Получили новый статус {homework_name} - {verdict}")
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+
+def _is_new_error(last_error: tuple, message: str, now: float) -> bool:
+    """Проверяет, что такую ошибку не отправляли за ERROR_REPEAT_TIME."""
+    last_error_hash, last_error_time = last_error
+    return (
+        hash(message) != last_error_hash
+        or now - last_error_time > ERROR_REPEAT_TIME
+    )
+
+
+def _send_statuses(bot, homeworks: list, sent_statuses: OrderedDict):
+    """Отправляет новые статусы одним сообщением, затем сообщает о сбоях.
+
+    Возвращает True, если пользователю дошел хотя бы один новый статус.
+    """
+    # API отдает новые работы первыми, а читать удобнее по порядку.
+    # Битая домашка не должна мешать отправить остальные: ошибки
+    # разбора копим и поднимаем уже после отправки
+    parsed = []
+    messages = []
+    errors = []
+    for homework in reversed(homeworks):
+        try:
+            if not _is_new_status(sent_statuses, homework):
+                continue
+            messages.append(parse_status(homework))
+        except (KeyError, TypeError, AttributeError) as exc:
+            logger.error("Не удалось разобрать homework: %s", exc)
+            errors.append(exc)
+        else:
+            parsed.append(homework)
+
+    # Делим сообщение, только если не влезает в лимит телеграма
+    chunks = _chunks("\n\n".join(messages), MESSAGE_MAX_LENGTH)
+    delivered = True
+    for number, chunk in enumerate(chunks):
+        if number:
+            time.sleep(ANTISPAM_TIME)
+        delivered = send_message(bot, chunk) and delivered
+
+    # Запоминаем статусы, только если сообщение дошло до пользователя
+    if delivered:
+        for homework in parsed:
+            _remember_status(sent_statuses, homework)
+
+    if errors:
+        raise errors[0]
+    return bool(messages) and delivered
 
 
 def check_tokens():
     """Проверяет доступность переменных окружения."""
-    tokens = {
-        "PRACTICUM_TOKEN": PRACTICUM_TOKEN,
-        "TELEGRAM_TOKEN": TELEGRAM_TOKEN,
-        "TELEGRAM_CHAT_ID": TELEGRAM_CHAT_ID,
-    }
-
-    try:
-        for key, value in tokens.items():
-            if not value:
-                raise TokenLack(
-                    "Отсутствует обязательная " f"переменная окружения: {key}"
-                )
-    except TokenLack as exc:
-        logger.critical(exc)
+    missing = [name for name in TOKEN_NAMES if not globals()[name]]
+    if missing:
+        logger.critical(
+            "Отсутствуют обязательные переменные окружения: %s",
+            ", ".join(missing),
+        )
         return False
 
     logger.debug("Проверили переменные окружения, все подгружены")
@@ -135,38 +275,41 @@ def check_tokens():
 def main():
     """Основная логика работы бота."""
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
-    current_timestamp = int(time.time())
-    last_exc_message = ""
+    # Дальше from_date берем только из current_date ответа API,
+    # локальные часы могут прыгать при синхронизации времени
+    current_timestamp = int(time.time()) - RETRY_TIME
+    last_error = (0, 0.0)
+    sent_statuses = OrderedDict()
+    retry_time = MIN_RETRY_TIME
     while True:
+        started = time.monotonic()
+        has_updates = False
         try:
             response = get_api_answer(current_timestamp)
             current_timestamp = response["current_date"]
             homeworks = check_response(response)
-
-            # Отправляем все статусы за последние RETRY_TIME секунд
-            while homeworks:
-                homework = homeworks.pop()
-                message = parse_status(homework)
-
-                send_message(bot, message)
-                time.sleep(ANTISPAM_TIME)
+            has_updates = _send_statuses(bot, homeworks, sent_statuses)
 
         except Exception as error:
+            logger.error("Сбой в работе программы: %s", error)
             message = f"Сбой в работе программы: {error}"
-            logger.error(message)
-            if last_exc_message != message:
+            now = time.monotonic()
+            if _is_new_error(last_error, message, now):
                 successfully_sending: bool = send_message(bot, message)
                 if successfully_sending:
-                    last_exc_message = message
+                    last_error = (hash(message), now)
 
-        logger.info(f"Ждем {RETRY_TIME} секунд")
-        time.sleep(RETRY_TIME)
+        if has_updates:
+            retry_time = MIN_RETRY_TIME
+        else:
+            retry_time = min(RETRY_TIME, retry_time * 2)
+        sleep_time = max(0, started + retry_time - time.monotonic())
+        logger.info("Ждем %.0f секунд", sleep_time)
+        time.sleep(sleep_time)
 
 
 if __name__ == "__main__":
-    logging.basicConfig(
-        format="%(asctime)s  [%(levelname)s]  %(message)s", level=logging.INFO
-    )
+    logging.basicConfig(format=LOG_FORMAT, level=logging.INFO)
 
     if check_tokens():
         logger.info("Запуск бота")
@@ -186,7 +186,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -232,7 +232,7 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_500_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_500_response_get))
 
         import homework
 
@@ -315,7 +315,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -352,7 +352,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -400,7 +400,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -448,7 +448,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -484,7 +484,7 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_no_homeworks_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_no_homeworks_response_get))
 
         import homework
 
@@ -525,7 +525,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -565,7 +565,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -599,7 +599,7 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_empty_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_empty_response_get))
 
         import homework
 
@@ -626,7 +626,7 @@ class TestHomework:
             )
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', staticmethod(mock_response_get))
 
         import homework
 
@@ -640,3 +640,127 @@ class TestHomework:
                 f'Убедитесь, что в функции `{func_name}` обрабатываете ситуацию, '
                 'когда API возвращает код, отличный от 200'
             )
+
+    def test_chunks(self):
+        import homework
+
+        func_name = '_chunks'
+        utils.check_function(homework, func_name, 2)
+
+        text = 'a' * 10 + '\n\n' + 'b' * 10 + '\n\n' + 'c' * 30
+        chunks = list(homework._chunks(text, 22))
+        assert chunks == ['a' * 10 + '\n\n' + 'b' * 10, 'c' * 22, 'c' * 8], (
+            f'Проверьте, что функция `{func_name}` делит текст по абзацам '
+            'и не возвращает части длиннее лимита'
+        )
+        assert list(homework._chunks('short', 4096)) == ['short'], (
+            f'Проверьте, что функция `{func_name}` не делит короткий текст'
+        )
+
+    def test_is_new_status(self):
+        from collections import OrderedDict
+
+        import homework
+
+        func_name = '_is_new_status'
+        utils.check_function(homework, func_name, 2)
+
+        sent_statuses = OrderedDict()
+        hw = {'homework_name': 'hw123', 'status': 'reviewing'}
+        assert homework._is_new_status(sent_statuses, hw), (
+            f'Проверьте, что функция `{func_name}` пропускает новый статус'
+        )
+        assert homework._is_new_status(sent_statuses, hw), (
+            f'Проверьте, что функция `{func_name}` не запоминает статус, '
+            'который еще не отправлен'
+        )
+        homework._remember_status(sent_statuses, hw)
+        assert not homework._is_new_status(sent_statuses, hw), (
+            f'Проверьте, что функция `{func_name}` отсеивает уже '
+            'отправленный статус'
+        )
+        hw['status'] = 'approved'
+        assert homework._is_new_status(sent_statuses, hw), (
+            f'Проверьте, что функция `{func_name}` пропускает '
+            'изменившийся статус'
+        )
+        for broken_hw in ({'homework_name': 'hw123'}, {}):
+            assert homework._is_new_status(sent_statuses, broken_hw), (
+                f'Проверьте, что функция `{func_name}` не отсеивает '
+                'домашку без ключа `status`'
+            )
+
+    def test_send_statuses_skips_broken_homework(self, monkeypatch):
+        from collections import OrderedDict
+
+        import homework
+
+        class RecordingBot:
+            def __init__(self):
+                self.texts = []
+
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                self.texts.append(text)
+
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        bot = RecordingBot()
+        sent_statuses = OrderedDict()
+        homeworks = [
+            'not a dict',
+            {'homework_name': 'new', 'status': 'unknown'},
+            {'homework_name': 'old', 'status': 'approved'},
+        ]
+        func_name = '_send_statuses'
+        try:
+            homework._send_statuses(bot, homeworks, sent_statuses)
+        except KeyError:
+            pass
+        else:
+            assert False, (
+                f'Убедитесь, что функция `{func_name}` сообщает об ошибке '
+                'при недокументированном статусе домашней работы'
+            )
+        assert len(bot.texts) == 1 and bot.texts[0].startswith(
+            'Изменился статус проверки работы "old"'
+        ), (
+            f'Убедитесь, что функция `{func_name}` отправляет корректные '
+            'статусы, даже если одна из домашек не разобралась'
+        )
+        assert dict(sent_statuses) == {'old': 'approved'}, (
+            f'Убедитесь, что функция `{func_name}` запоминает только '
+            'доставленные статусы'
+        )
+        old_hw = {'homework_name': 'old', 'status': 'approved'}
+        assert not homework._send_statuses(bot, [old_hw], sent_statuses), (
+            f'Убедитесь, что функция `{func_name}` возвращает False, '
+            'если новых статусов не было'
+        )
+        old_hw['status'] = 'rejected'
+        assert homework._send_statuses(bot, [old_hw], sent_statuses), (
+            f'Убедитесь, что функция `{func_name}` возвращает True '
+            'после отправки нового статуса'
+        )
+
+    def test_is_new_error(self):
+        import homework
+
+        func_name = '_is_new_error'
+        utils.check_function(homework, func_name, 3)
+
+        message = 'Сбой в работе программы: ошибка'
+        last_error = (hash(message), 1000.0)
+        assert homework._is_new_error((0, 0.0), message, 1000.0), (
+            f'Проверьте, что функция `{func_name}` пропускает новую ошибку'
+        )
+        assert not homework._is_new_error(last_error, message, 1010.0), (
+            f'Проверьте, что функция `{func_name}` не повторяет ошибку '
+            'раньше ERROR_REPEAT_TIME'
+        )
+        later = 1001.0 + homework.ERROR_REPEAT_TIME
+        assert homework._is_new_error(last_error, message, later), (
+            f'Проверьте, что функция `{func_name}` повторяет ошибку '
+            'после ERROR_REPEAT_TIME'
+        )
+        assert homework._is_new_error(last_error, 'другая ошибка', 1010.0), (
+            f'Проверьте, что функция `{func_name}` пропускает другую ошибку'
+        )